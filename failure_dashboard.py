@@ -5,6 +5,7 @@ import matplotlib.pyplot as plt
 import seaborn as sns
 from scipy import stats
 import json
+import hashlib
 import os
 import re
 import time
@@ -26,6 +27,9 @@ LOCATION_COL = 'Location_Type_EN'  # Location type
 STATION_COL = 'Station'  # Korean station name
 STATION_EN_COL = 'Station_EN'  # English station name
 STATION_RUNS_COL = 'Station_Daily_Runs'  # Continuous covariate
+LINE_STATION_COL = 'LineStation'  # Korean line + station name
+LINE_STATION_EN_COL = 'LineStation_EN'  # English line + station name
+PLATFORM_DOOR_COL = 'PlatformDoor'  # Platform and door position within a station
 
 # --- Covariate Names ---
 STATION_RUNS_STD_COEF = f"Q('{STATION_RUNS_COL}_std')"
@@ -35,6 +39,18 @@ LOCATION_UNKNOWN_COEF = f"Q('{LOCATION_COL}_Unknown')"
 # --- Time Horizons ---
 TIME_HORIZONS_DAYS = [365, 365*2, 365*3, 365*5, 365*7, 365*10]
 TIME_HORIZONS_LABELS = ["1 Year", "2 Years", "3 Years", "5 Years", "7 Years", "10 Years"]
+TIME_HORIZONS_LABEL_KEYS = ["1_year", "2_years", "3_years", "5_years", "7_years", "10_years"]
+
+# --- Daily Runs Sensitivity Sweep ---
+SWEEP_LOCATION_TYPES = ('Above Ground', 'Underground')
+SWEEP_RUNS_STEP = 1  # Daily runs resolution of the sweep grid
+RUNS_ELASTICITY_FLAG = 0.5  # d ln(Median TTF) / d ln(runs) above which the runs effect is flagged
+
+# --- Door-Level Reliability ---
+DOOR_ID_COLS = [LINE_STATION_EN_COL, PLATFORM_DOOR_COL]
+DOOR_ID_PATTERN = r'_\d+-\d+$'  # Single door IDs ('1번홈_1-4'); excludes platform-level and multi-door records
+DOOR_TIME_GRID_DAYS = np.linspace(0, 365*15, 15*52 + 1)  # Weekly grid, well past the longest horizon
+DOOR_TOP_N = 20  # Number of highest-risk stations listed
 
 # --- Translations ---
 translations = {
@@ -90,6 +106,37 @@ translations = {
         "hover_years": "years",
         "custom_pred_plot_title": "Custom Failure Prediction for",
         "no_model_warning": "No model parameters available for",
+        "tab_runs_sensitivity": "Runs Sensitivity",
+        "runs_sensitivity_title": "Daily Runs Sensitivity Sweep",
+        "runs_sensitivity_desc": """**Methodology:** This view evaluates every component's Weibull AFT model across the full observed range of **Station Daily Runs** at once, instead of one scenario at a time as in the Custom Prediction tool.\n\n*   **Calculation:** For each component, location type and daily runs value on the grid, the scale parameter is adjusted exactly as in the Custom Prediction tool, and the Median TTF and failure probabilities at each time horizon are derived from it. The **local derivative** shows how much the selected metric changes per additional daily run. The **elasticity** of Median TTF (the percentage change in Median TTF per percentage change in daily runs) is used to outline the region where the runs effect dominates.\n*   **Interpretation:** Outlined cells are where more daily runs *lengthen* the expected lifespan strongly, i.e. where the counter-intuitive runs effect described in the Custom Prediction tab drives the result. Predictions in these regions should be treated with particular caution.""",
+        "sweep_metric_label": "Metric:",
+        "sweep_metric_median_ttf": "Median TTF (Years)",
+        "sweep_metric_failure_prob": "Failure Probability at",
+        "sweep_heatmap_title": "Sensitivity to Daily Runs",
+        "sweep_small_multiples_title": "Per-Component Response to Daily Runs",
+        "sweep_slope_label": "Change per Daily Run",
+        "sweep_flag_label": "Runs effect dominates (elasticity ≥ {threshold})",
+        "sweep_compute_time": "{n_scenarios:,} scenarios evaluated in {elapsed_ms:.0f} ms",
+        "daily_runs_axis_label": "Daily Runs",
+        "tab_door_reliability": "Door Reliability",
+        "door_reliability_title": "Door-Level System Reliability",
+        "door_reliability_desc": """**Methodology:** Each Platform Screen Door is a **series system** of its components (Motor, DCU, sensors and Electrical Stop): the door is out of service as soon as *any* component fails. This view combines all component Weibull AFT models into one reliability estimate per door.\n\n*   **Calculation:** For every door in the dataset, each component's model is adjusted for the door's **Location Type** and **Station Daily Runs** exactly as in the Custom Prediction tool. The **door survival** is the product of the component survival probabilities. The **expected time to first failure** is the area under the door survival curve (over a 15-year window). A component's **risk share** is the probability that it is the first component of the door to fail.\n*   **Interpretation:** Doors with a high failure probability at the selected horizon are the most likely to need intervention. The risk shares show which components drive that risk, which helps prioritise spare parts and preventive maintenance. The daily runs limitation described in the Custom Prediction tab also applies here.""",
+        "door_horizon_label": "Rank by failure probability at:",
+        "door_count_caption": "{n_doors:,} doors evaluated",
+        "door_top_title": "Highest-Risk Stations",
+        "door_top_caption": "Doors at the same station and location type share one estimate, so each row covers all of those doors.",
+        "door_col_station": "Line / Station",
+        "door_col_door_count": "Doors",
+        "door_col_mttff": "Expected Time to First Failure (Years)",
+        "door_col_failure_prob": "Failure Probability",
+        "door_col_top_component": "Top Risk Component",
+        "fleet_risk_share_title": "Average Component Risk Share Across All Doors",
+        "risk_share_axis_label": "Share of First Failures",
+        "select_door_label": "Select Door:",
+        "door_curve_title": "Failure Probability for Door",
+        "door_system_label": "Whole Door",
+        "door_risk_share_title": "Component Risk Share for Door",
+        "door_mttff_metric_label": "Expected Time to First Failure",
         # Time horizon labels
         "1_year": "1 Year", "2_years": "2 Years", "3_years": "3 Years", "5_years": "5 Years", "7_years": "7 Years", "10_years": "10 Years"
     },
@@ -145,6 +192,37 @@ translations = {
         "hover_years": "년",
         "custom_pred_plot_title": "사용자 정의 고장 예측:",
         "no_model_warning": "사용 가능한 모델 매개변수 없음:",
+        "tab_runs_sensitivity": "운행 횟수 민감도",
+        "runs_sensitivity_title": "일일 운행 횟수 민감도 분석",
+        "runs_sensitivity_desc": """**방법론:** 이 화면은 사용자 정의 예측 도구처럼 한 번에 하나의 시나리오를 계산하는 대신, 관측된 **역별 일일 운행 횟수** 전체 범위에 걸쳐 모든 구성요소의 Weibull AFT 모델을 한 번에 평가합니다.\n\n*   **계산:** 각 구성요소, 위치 유형 및 격자상의 일일 운행 횟수 값에 대해 사용자 정의 예측 도구와 동일한 방식으로 척도 모수를 조정하고, 이로부터 Median TTF와 각 기간별 고장 확률을 계산합니다. **국소 도함수**는 일일 운행 횟수가 1회 증가할 때 선택한 지표가 얼마나 변하는지를 보여줍니다. Median TTF의 **탄력성**(일일 운행 횟수 변화율 대비 Median TTF 변화율)을 사용하여 운행 횟수의 영향이 지배적인 영역의 경계를 표시합니다.\n*   **해석:** 경계선 안의 영역은 운행 횟수가 많을수록 예상 수명이 크게 *길어지는* 곳, 즉 사용자 정의 예측 탭에서 설명한 직관에 반하는 운행 횟수 효과가 결과를 좌우하는 곳입니다. 이 영역의 예측은 특히 주의해서 해석해야 합니다.""",
+        "sweep_metric_label": "지표:",
+        "sweep_metric_median_ttf": "고장까지의 중위 시간 (년)",
+        "sweep_metric_failure_prob": "고장 확률:",
+        "sweep_heatmap_title": "일일 운행 횟수에 대한 민감도",
+        "sweep_small_multiples_title": "구성요소별 일일 운행 횟수 반응",
+        "sweep_slope_label": "운행 1회당 변화",
+        "sweep_flag_label": "운행 횟수 효과 지배 영역 (탄력성 ≥ {threshold})",
+        "sweep_compute_time": "{n_scenarios:,}개 시나리오를 {elapsed_ms:.0f} ms 만에 계산",
+        "daily_runs_axis_label": "일일 운행 횟수",
+        "tab_door_reliability": "도어 신뢰도",
+        "door_reliability_title": "도어 단위 시스템 신뢰도",
+        "door_reliability_desc": """**방법론:** 각 승강장 스크린도어는 구성요소(모터, DCU, 센서류, 전기적 정지)의 **직렬 시스템**입니다. 즉, *어느 하나*의 구성요소라도 고장나면 도어는 운행할 수 없습니다. 이 화면은 모든 구성요소의 Weibull AFT 모델을 결합하여 도어별 신뢰도를 추정합니다.\n\n*   **계산:** 데이터셋의 모든 도어에 대해, 각 구성요소 모델을 사용자 정의 예측 도구와 동일한 방식으로 도어의 **위치 유형** 및 **역별 일일 운행 횟수**에 맞게 조정합니다. **도어 생존 확률**은 구성요소 생존 확률의 곱입니다. **첫 고장까지의 기대 시간**은 도어 생존 곡선 아래의 면적(15년 구간)입니다. 구성요소의 **위험 비중**은 해당 구성요소가 도어에서 가장 먼저 고장날 확률입니다.\n*   **해석:** 선택한 기간의 고장 확률이 높은 도어일수록 조치가 필요할 가능성이 큽니다. 위험 비중은 어떤 구성요소가 위험을 주도하는지 보여주어 예비 부품 및 예방 정비의 우선순위를 정하는 데 도움이 됩니다. 사용자 정의 예측 탭에서 설명한 일일 운행 횟수 관련 제한사항이 여기에도 적용됩니다.""",
+        "door_horizon_label": "고장 확률 기준 기간:",
+        "door_count_caption": "{n_doors:,}개 도어 평가 완료",
+        "door_top_title": "고위험 역",
+        "door_top_caption": "같은 역과 위치 유형의 도어는 하나의 추정치를 공유하므로, 각 행은 해당 도어 전체를 나타냅니다.",
+        "door_col_station": "노선 / 역",
+        "door_col_door_count": "도어 수",
+        "door_col_mttff": "첫 고장까지의 기대 시간 (년)",
+        "door_col_failure_prob": "고장 확률",
+        "door_col_top_component": "최고 위험 구성요소",
+        "fleet_risk_share_title": "전체 도어의 평균 구성요소 위험 비중",
+        "risk_share_axis_label": "첫 고장 비중",
+        "select_door_label": "도어 선택:",
+        "door_curve_title": "도어 고장 확률:",
+        "door_system_label": "도어 전체",
+        "door_risk_share_title": "도어 구성요소 위험 비중:",
+        "door_mttff_metric_label": "첫 고장까지의 기대 시간",
         # Time horizon labels (Korean)
         "1_year": "1년", "2_years": "2년", "3_years": "3년", "5_years": "5년", "7_years": "7년", "10_years": "10년"
     }
@@ -263,6 +341,188 @@ def calculate_custom_survival_probabilities(component_name, station_runs, locati
     
     return results
 
+def build_runs_grid(df):
+    """Build the daily runs grid spanning the observed station runs range."""
+    runs = df[STATION_RUNS_COL].dropna()
+    runs_min = np.floor(runs.min()) if not runs.empty else 0
+    runs_max = np.ceil(runs.max()) if not runs.empty else 0
+    # np.gradient needs at least two points along the runs axis
+    runs_max = max(runs_max, runs_min + SWEEP_RUNS_STEP)
+    return np.arange(runs_min, runs_max + SWEEP_RUNS_STEP, SWEEP_RUNS_STEP, dtype=float)
+
+def get_component_model_arrays(params_data, location_types):
+    """
+    Stack the Weibull AFT parameters of all usable component models into arrays.
+    Returns component names, log shape (C,), base log scale (C,), runs coefficient (C,)
+    and location coefficients (C, L) for the given location types.
+    """
+    # Keep only components with a usable base model
+    component_models = {
+        name: params for name, params in params_data['component_models'].items()
+        if params.get('log_rho') is not None and params.get('log_lambda') is not None
+    }
+    components = list(component_models)
+    coefficients = [params.get('coef', {}) for params in component_models.values()]
+
+    log_shape = np.array([params['log_rho'] for params in component_models.values()], dtype=float)
+    base_log_lambda = np.array([params['log_lambda'] for params in component_models.values()], dtype=float)
+    runs_coef = np.array([coef.get(STATION_RUNS_STD_COEF, 0.0) for coef in coefficients], dtype=float)
+    location_coef_names = {'Underground': LOCATION_UNDERGROUND_COEF, 'Unknown': LOCATION_UNKNOWN_COEF}
+    location_coef = np.array([
+        [coef.get(location_coef_names.get(location), 0.0) for location in location_types]
+        for coef in coefficients
+    ], dtype=float).reshape(len(components), len(location_types))
+
+    return components, log_shape, base_log_lambda, runs_coef, location_coef
+
+def standardize_runs(runs, std_stats):
+    """Standardize daily runs the same way the models were fitted (zero effect if stats are missing)."""
+    runs = np.asarray(runs, dtype=float)
+    if STATION_RUNS_COL in std_stats:
+        mean = std_stats[STATION_RUNS_COL].get('mean', 0)
+        std = std_stats[STATION_RUNS_COL].get('std', 1)
+        if std > 0:
+            return (runs - mean) / std
+    return np.zeros_like(runs)
+
+@st.cache_data
+def calculate_runs_sensitivity(params_data, runs_grid, location_types=SWEEP_LOCATION_TYPES):
+    """
+    Sweep daily runs for all components x location types in one broadcasted computation.
+    Mirrors adjust_scale_for_covariates, so every grid cell matches the Custom Prediction tool.
+    Arrays are shaped (components, locations, runs), with a trailing horizons axis for failure probabilities.
+    The evaluation time is returned with the results, so cache hits still report the real computation time.
+    """
+    start_time = time.perf_counter()
+    runs_grid = np.asarray(runs_grid, dtype=float)
+    horizons = np.asarray(TIME_HORIZONS_DAYS, dtype=float)
+    components, log_shape, base_log_lambda, runs_coef, location_coef = get_component_model_arrays(params_data, location_types)
+    standardized_runs = standardize_runs(runs_grid, params_data['standardization_stats'])
+
+    # (C, L, R) scale and (C, 1, 1) shape
+    log_scale = (
+        base_log_lambda[:, None, None]
+        + location_coef[:, :, None]
+        + runs_coef[:, None, None] * standardized_runs[None, None, :]
+    )
+    shape = np.exp(log_shape)[:, None, None]
+    scale = np.exp(log_scale)
+
+    # Median = scale * (ln(2))^(1/shape); Weibull CDF = 1 - exp(-(t/scale)^shape)
+    median_ttf = scale * np.log(2) ** (1 / shape)
+    failure_prob = 1.0 - np.exp(-(horizons / scale[..., None]) ** shape[..., None])
+
+    # Local derivatives along the runs axis
+    median_ttf_slope = np.gradient(median_ttf, runs_grid, axis=2)
+    failure_prob_slope = np.gradient(failure_prob, runs_grid, axis=2)
+    # Positive elasticity means more runs -> longer lifespan (the counter-intuitive direction)
+    median_ttf_elasticity = median_ttf_slope * runs_grid / median_ttf
+
+    return {
+        'components': components,
+        'location_types': list(location_types),
+        'runs_grid': runs_grid,
+        'median_ttf': median_ttf,
+        'median_ttf_slope': median_ttf_slope,
+        'median_ttf_elasticity': median_ttf_elasticity,
+        'failure_prob': failure_prob,
+        'failure_prob_slope': failure_prob_slope,
+        'elapsed_ms': (time.perf_counter() - start_time) * 1000,
+    }
+
+def get_params_version(params_data):
+    """Return a stable hash of the model parameters, used as the door reliability cache key."""
+    return hashlib.sha1(json.dumps(params_data, sort_keys=True).encode('utf-8')).hexdigest()
+
+def build_door_table(df):
+    """One row per PlatformDoor with the covariates its component models need."""
+    # Only individual doors are series systems of all components
+    is_door = df[PLATFORM_DOOR_COL].astype(str).str.contains(DOOR_ID_PATTERN, regex=True, na=False)
+    door_df = (
+        df[is_door]
+        .dropna(subset=DOOR_ID_COLS)
+        .groupby(DOOR_ID_COLS, as_index=False)
+        .agg(**{
+            LINE_STATION_COL: (LINE_STATION_COL, 'first'),
+            STATION_EN_COL: (STATION_EN_COL, 'first'),
+            LOCATION_COL: (LOCATION_COL, 'first'),
+            STATION_RUNS_COL: (STATION_RUNS_COL, 'mean'),
+        })
+    )
+    return door_df
+
+@st.cache_data
+def calculate_door_reliability(door_df, params_version, _params_data, time_grid=DOOR_TIME_GRID_DAYS):
+    """
+    Door-level reliability, treating each PlatformDoor as a series system of all component models.
+    Combined survival is the product of component survivals; the expected time to first failure is
+    its integral over `time_grid`; a component's risk share is its probability of being the first to fail.
+    `_params_data` is not hashed: the cache is keyed on `params_version` (see get_params_version).
+    Returns per-door results and the survival curves, indexed by covariate profile.
+    """
+    time_grid = np.asarray(time_grid, dtype=float)
+    horizons = np.asarray(TIME_HORIZONS_DAYS, dtype=float)
+    std_stats = _params_data['standardization_stats']
+
+    # Doors with the same location and daily runs share identical curves, so evaluate each
+    # distinct covariate profile once and index back to doors
+    runs_mean = std_stats.get(STATION_RUNS_COL, {}).get('mean', 0)
+    door_runs = door_df[STATION_RUNS_COL].fillna(runs_mean).to_numpy(dtype=float)
+    location_codes, location_types = pd.factorize(door_df[LOCATION_COL])
+    profiles, door_profile_idx = np.unique(
+        np.column_stack([location_codes, door_runs]), axis=0, return_inverse=True
+    )
+    door_profile_idx = door_profile_idx.reshape(-1)
+    profile_location_idx = profiles[:, 0].astype(int)
+    profile_runs = profiles[:, 1]
+
+    components, log_shape, base_log_lambda, runs_coef, location_coef = get_component_model_arrays(_params_data, list(location_types))
+    # Unmatched location codes (-1, i.e. missing) get no location adjustment
+    location_coef = np.column_stack([location_coef, np.zeros(len(components))])
+
+    # (P, C) scale and (1, C) shape
+    log_scale = (
+        base_log_lambda[None, :]
+        + location_coef[:, profile_location_idx].T
+        + runs_coef[None, :] * standardize_runs(profile_runs, std_stats)[:, None]
+    )
+    shape = np.exp(log_shape)[None, :]
+    scale = np.exp(log_scale)
+
+    # (P, C, T) cumulative hazards; series system survival is exp(-sum of cumulative hazards)
+    cum_hazard = (time_grid[None, None, :] / scale[..., None]) ** shape[..., None]
+    component_survival = np.exp(-cum_hazard)
+    system_survival = np.exp(-cum_hazard.sum(axis=1))
+
+    # Expected time to first failure (restricted to the time grid), trapezoidal rule
+    dt = np.diff(time_grid)
+    system_survival_mid = 0.5 * (system_survival[:, 1:] + system_survival[:, :-1])
+    mttff = (system_survival_mid * dt).sum(axis=1)
+
+    # P(component i fails first) = integral of h_i(t) * S_system(t) dt, using hazard increments
+    first_failure = (np.diff(cum_hazard, axis=2) * system_survival_mid[:, None, :]).sum(axis=2)
+    risk_share = first_failure / first_failure.sum(axis=1, keepdims=True)
+
+    # Survival at the standard horizons, evaluated exactly rather than on the grid
+    horizon_survival = np.exp(-((horizons[None, None, :] / scale[..., None]) ** shape[..., None]).sum(axis=1))
+
+    results_df = door_df.reset_index(drop=True).copy()
+    results_df['MTTFF_Days'] = mttff[door_profile_idx]
+    for h_idx, horizon in enumerate(TIME_HORIZONS_DAYS):
+        results_df[f'Survival_Prob_{horizon}d'] = horizon_survival[door_profile_idx, h_idx]
+    for c_idx, component in enumerate(components):
+        results_df[f'Risk_Share_{component}'] = risk_share[door_profile_idx, c_idx]
+    results_df['Top_Risk_Component'] = np.array(components)[risk_share.argmax(axis=1)][door_profile_idx]
+
+    curves = {
+        'components': components,
+        'time_grid': time_grid,
+        'door_profile_idx': door_profile_idx,
+        'component_survival': component_survival,
+        'system_survival': system_survival,
+    }
+    return results_df, curves
+
 def plot_failure_curves(filtered_insights_df, lang, components=None, location_type=None):
     """
     Plot failure probability curves for selected components and location type.
@@ -448,6 +708,200 @@ def plot_custom_prediction(component_name, station_runs, location_type_key, para
 
     return fig, results
 
+def get_sweep_metric(sweep, metric_key):
+    """
+    Select the metric values and local derivatives from a sensitivity sweep.
+    `metric_key` is 'median_ttf' or a time horizon in days.
+    """
+    if metric_key == 'median_ttf':
+        # Report Median TTF in years, as in the failure curves
+        return sweep['median_ttf'] / 365, sweep['median_ttf_slope'] / 365
+    horizon_idx = TIME_HORIZONS_DAYS.index(metric_key)
+    return sweep['failure_prob'][..., horizon_idx], sweep['failure_prob_slope'][..., horizon_idx]
+
+def plot_runs_sensitivity_heatmap(sweep, metric_key, metric_label, location_type_key, lang, component_display_map=None):
+    """
+    Plot heatmaps of the selected metric and its local derivative over components x daily runs.
+    The region where the counter-intuitive runs effect dominates is outlined on the derivative.
+    """
+    if location_type_key not in sweep['location_types'] or not sweep['components']:
+        st.warning(translations[lang]['no_data_warning'])
+        return None
+
+    loc_idx = sweep['location_types'].index(location_type_key)
+    values, slopes = get_sweep_metric(sweep, metric_key)
+    values, slopes = values[:, loc_idx, :], slopes[:, loc_idx, :]
+    elasticity = sweep['median_ttf_elasticity'][:, loc_idx, :]
+    runs_grid = sweep['runs_grid']
+    component_display_map = component_display_map or {}
+    component_labels = [component_display_map.get(name, name) for name in sweep['components']]
+    value_format = ".2f" if metric_key == 'median_ttf' else ".1%"
+
+    fig = make_subplots(
+        rows=2, cols=1, shared_xaxes=True, vertical_spacing=0.08,
+        subplot_titles=(metric_label, translations[lang]['sweep_slope_label'])
+    )
+    fig.add_trace(
+        go.Heatmap(
+            x=runs_grid, y=component_labels, z=values,
+            colorscale='Viridis', colorbar=dict(y=0.78, len=0.45),
+            hovertemplate=f"%{{y}}<br>%{{x}} {translations[lang]['daily_runs_axis_label']}<br><b>%{{z:{value_format}}}</b><extra></extra>"
+        ),
+        row=1, col=1
+    )
+    fig.add_trace(
+        go.Heatmap(
+            x=runs_grid, y=component_labels, z=slopes,
+            colorscale='RdBu', zmid=0, colorbar=dict(y=0.22, len=0.45),
+            hovertemplate=f"%{{y}}<br>%{{x}} {translations[lang]['daily_runs_axis_label']}<br><b>%{{z:.3g}}</b><extra></extra>"
+        ),
+        row=2, col=1
+    )
+    # Outline where Median TTF is elastic to runs in the counter-intuitive direction
+    if np.nanmax(elasticity) >= RUNS_ELASTICITY_FLAG:
+        fig.add_trace(
+            go.Contour(
+                x=runs_grid, y=component_labels, z=elasticity,
+                contours=dict(start=RUNS_ELASTICITY_FLAG, end=RUNS_ELASTICITY_FLAG, coloring='none'),
+                line=dict(color='black', width=2, dash='dash'),
+                showscale=False, hoverinfo='skip', showlegend=True,
+                name=translations[lang]['sweep_flag_label'].format(threshold=RUNS_ELASTICITY_FLAG)
+            ),
+            row=2, col=1
+        )
+
+    fig.update_xaxes(title_text=translations[lang]['daily_runs_axis_label'], row=2, col=1)
+    fig.update_layout(
+        title=translations[lang]['sweep_heatmap_title'],
+        legend=dict(orientation="h", yanchor="bottom", y=-0.2, xanchor="center", x=0.5),
+        height=800
+    )
+    return fig
+
+def plot_runs_sensitivity_small_multiples(sweep, metric_key, metric_label, lang, component_display_map=None, mean_runs=None):
+    """
+    Plot one small panel per component showing the selected metric against daily runs for each location type.
+    """
+    if not sweep['components']:
+        st.warning(translations[lang]['no_data_warning'])
+        return None
+
+    values, _ = get_sweep_metric(sweep, metric_key)
+    runs_grid = sweep['runs_grid']
+    component_display_map = component_display_map or {}
+    component_labels = [component_display_map.get(name, name) for name in sweep['components']]
+    n_cols = 3
+    n_rows = int(np.ceil(len(component_labels) / n_cols))
+    value_format = ".2f" if metric_key == 'median_ttf' else ".1%"
+    colors = px.colors.qualitative.Plotly
+
+    fig = make_subplots(
+        rows=n_rows, cols=n_cols, shared_xaxes=True, shared_yaxes=True,
+        subplot_titles=component_labels, vertical_spacing=0.1
+    )
+    for comp_idx in range(len(component_labels)):
+        row, col = comp_idx // n_cols + 1, comp_idx % n_cols + 1
+        for loc_idx, location_key in enumerate(sweep['location_types']):
+            loc_display_name = translations[lang].get(f'location_{location_key.lower().replace(" ", "_")}', location_key)
+            fig.add_trace(
+                go.Scatter(
+                    x=runs_grid,
+                    y=values[comp_idx, loc_idx, :],
+                    mode='lines',
+                    name=loc_display_name,
+                    legendgroup=location_key,
+                    showlegend=comp_idx == 0,
+                    line=dict(color=colors[loc_idx % len(colors)]),
+                    hovertemplate=f"%{{x}} {translations[lang]['daily_runs_axis_label']}<br><b>%{{y:{value_format}}}</b><extra></extra>"
+                ),
+                row=row, col=col
+            )
+        if mean_runs is not None:
+            fig.add_vline(x=mean_runs, line=dict(color='grey', dash='dot'), row=row, col=col)
+
+    if metric_key != 'median_ttf':
+        fig.update_yaxes(tickformat=".0%")
+    fig.update_layout(
+        title=f"{translations[lang]['sweep_small_multiples_title']} - {metric_label}",
+        legend=dict(orientation="h", yanchor="bottom", y=-0.15, xanchor="center", x=0.5, title=translations[lang]['location_type_legend_label']),
+        height=300 * n_rows,
+        hovermode="closest"
+    )
+    return fig
+
+def plot_risk_shares(risk_shares, title, lang, component_display_map=None):
+    """
+    Plot a bar chart of component risk shares (probability of being the first component to fail).
+    `risk_shares` maps English component names to shares.
+    """
+    if not risk_shares:
+        st.warning(translations[lang]['no_data_warning'])
+        return None
+
+    component_display_map = component_display_map or {}
+    shares_df = pd.DataFrame({
+        'Component_Display': [component_display_map.get(name, name) for name in risk_shares],
+        'Risk_Share': list(risk_shares.values())
+    }).sort_values('Risk_Share', ascending=False)
+
+    fig = px.bar(
+        shares_df,
+        x='Component_Display',
+        y='Risk_Share',
+        labels={
+            'Component_Display': translations[lang]['component_axis_label'],
+            'Risk_Share': translations[lang]['risk_share_axis_label']
+        },
+        title=title,
+        height=450
+    )
+    fig.update_layout(yaxis=dict(tickformat=".0%"))
+    return fig
+
+def plot_door_reliability(door_idx, door_label, curves, lang, component_display_map=None):
+    """
+    Plot the whole-door failure probability curve together with its component curves.
+    `door_idx` is the door's row position in the door reliability results.
+    """
+    profile_idx = curves['door_profile_idx'][door_idx]
+    time_grid_years = curves['time_grid'] / 365
+    component_display_map = component_display_map or {}
+    hovertemplate = f"<b>%{{y:.2%}}</b> {translations[lang]['hover_failure_prob']} %{{x:.1f}} {translations[lang]['hover_years']}<extra></extra>"
+
+    fig = go.Figure()
+    fig.add_trace(
+        go.Scatter(
+            x=time_grid_years,
+            y=1 - curves['system_survival'][profile_idx],
+            mode='lines',
+            name=translations[lang]['door_system_label'],
+            line=dict(color='black', width=3),
+            hovertemplate=hovertemplate
+        )
+    )
+    for c_idx, component_en in enumerate(curves['components']):
+        fig.add_trace(
+            go.Scatter(
+                x=time_grid_years,
+                y=1 - curves['component_survival'][profile_idx, c_idx],
+                mode='lines',
+                name=component_display_map.get(component_en, component_en),
+                line=dict(width=1),
+                hovertemplate=hovertemplate
+            )
+        )
+
+    fig.update_layout(
+        title=f"{translations[lang]['door_curve_title']} {door_label}",
+        xaxis_title=translations[lang]['years_axis_label'],
+        yaxis_title=translations[lang]['failure_prob_axis_label'],
+        yaxis=dict(tickformat=".0%", range=[0, 1]),
+        legend=dict(orientation="h", yanchor="bottom", y=-0.3, xanchor="center", x=0.5),
+        height=550,
+        hovermode="closest"
+    )
+    return fig
+
 # --- Main Dashboard ---
 def main():
     # Initialize session state for language if it doesn't exist
@@ -568,8 +1022,8 @@ def main():
     time_horizon_labels_display = [time_horizon_labels_map.get(lbl, lbl) for lbl in TIME_HORIZONS_LABELS]
 
     # Tabs for different visualizations
-    tab_labels = [translations[lang]["tab_failure_curves"], translations[lang]["tab_median_ttf"], translations[lang]["tab_custom_prediction"]]
-    tab1, tab2, tab3 = st.tabs(tab_labels)
+    tab_labels = [translations[lang]["tab_failure_curves"], translations[lang]["tab_median_ttf"], translations[lang]["tab_custom_prediction"], translations[lang]["tab_runs_sensitivity"], translations[lang]["tab_door_reliability"]]
+    tab1, tab2, tab3, tab4, tab5 = st.tabs(tab_labels)
 
     # Tab 1: Failure curves over time
     with tab1:
@@ -683,7 +1137,7 @@ def main():
                                  f"{results['Median_TTF_Days']/365:.1f} {translations[lang]['median_ttf_metric_unit_years']}"
                              )
                          prob_cols = st.columns(len(TIME_HORIZONS_DAYS))
-                         for i, (horizon, label_key) in enumerate(zip(TIME_HORIZONS_DAYS, ["1_year", "2_years", "3_years", "5_years", "7_years", "10_years"])):
+                         for i, (horizon, label_key) in enumerate(zip(TIME_HORIZONS_DAYS, TIME_HORIZONS_LABEL_KEYS)):
                              with prob_cols[i]:
                                  prob_value = results[f'Failure_Prob_{horizon}d'] 
                                  st.metric(
@@ -691,5 +1145,138 @@ def main():
                                      f"{prob_value:.1%}"
                                  )
 
+    # Tab 4: Sensitivity sweep over daily runs for all components
+    with tab4:
+        st.markdown(f"### {translations[lang]['runs_sensitivity_title']}")
+        st.markdown(translations[lang]['runs_sensitivity_desc'])
+
+        sweep_col1, sweep_col2 = st.columns(2)
+        with sweep_col1:
+            # Median TTF or failure probability at one of the time horizons
+            metric_options = ['median_ttf'] + TIME_HORIZONS_DAYS
+            metric_labels = {'median_ttf': translations[lang]['sweep_metric_median_ttf']}
+            for horizon, label_key in zip(TIME_HORIZONS_DAYS, TIME_HORIZONS_LABEL_KEYS):
+                metric_labels[horizon] = f"{translations[lang]['sweep_metric_failure_prob']} {translations[lang][label_key]}"
+            sweep_metric = st.selectbox(
+                translations[lang]["sweep_metric_label"],
+                options=metric_options,
+                format_func=lambda key: metric_labels[key]
+            )
+        with sweep_col2:
+            sweep_location_key = st.selectbox(
+                translations[lang]["select_location_type_label"],
+                options=list(SWEEP_LOCATION_TYPES),
+                format_func=lambda key: translations[lang].get(f'location_{key.lower().replace(" ", "_")}', key),
+                key='sweep_location'
+            )
+
+        sweep = calculate_runs_sensitivity(params_data, build_runs_grid(df))
+        n_scenarios = len(sweep['components']) * len(sweep['location_types']) * len(sweep['runs_grid'])
+        st.caption(translations[lang]['sweep_compute_time'].format(n_scenarios=n_scenarios, elapsed_ms=sweep['elapsed_ms']))
+
+        sweep_display_map = component_en_to_kr_map if lang == 'ko' else None
+        fig = plot_runs_sensitivity_heatmap(
+            sweep, sweep_metric, metric_labels[sweep_metric], sweep_location_key, lang, sweep_display_map
+        )
+        if fig:
+            st.plotly_chart(fig, use_container_width=True)
+
+        fig = plot_runs_sensitivity_small_multiples(
+            sweep, sweep_metric, metric_labels[sweep_metric], lang, sweep_display_map,
+            mean_runs=params_data['standardization_stats'][STATION_RUNS_COL]['mean']
+        )
+        if fig:
+            st.plotly_chart(fig, use_container_width=True)
+
+    # Tab 5: Door-level reliability combining all component models
+    with tab5:
+        st.markdown(f"### {translations[lang]['door_reliability_title']}")
+        st.markdown(translations[lang]['door_reliability_desc'])
+
+        door_results_df, door_curves = calculate_door_reliability(
+            build_door_table(df), get_params_version(params_data), params_data
+        )
+        st.caption(translations[lang]['door_count_caption'].format(n_doors=len(door_results_df)))
+        door_display_map = component_en_to_kr_map if lang == 'ko' else {}
+        door_station_col = LINE_STATION_COL if lang == 'ko' else LINE_STATION_EN_COL
+
+        door_horizon = st.selectbox(
+            translations[lang]["door_horizon_label"],
+            options=TIME_HORIZONS_DAYS,
+            format_func=lambda horizon: translations[lang][TIME_HORIZONS_LABEL_KEYS[TIME_HORIZONS_DAYS.index(horizon)]]
+        )
+        door_results_df['Failure_Prob'] = 1 - door_results_df[f'Survival_Prob_{door_horizon}d']
+        # Stable tie-break: doors sharing a covariate profile have identical risk
+        ranked_doors_df = door_results_df.sort_values(
+            ['Failure_Prob', LINE_STATION_EN_COL, PLATFORM_DOOR_COL], ascending=[False, True, True]
+        )
+
+        # Highest-risk stations at the selected horizon, one row per covariate profile
+        st.markdown(f"#### {translations[lang]['door_top_title']}")
+        st.caption(translations[lang]['door_top_caption'])
+        top_profiles_df = (
+            ranked_doors_df
+            .groupby([LINE_STATION_EN_COL, LOCATION_COL, STATION_RUNS_COL], dropna=False, sort=False, as_index=False)
+            .agg(
+                Station_Display=(door_station_col, 'first'),
+                Door_Count=(PLATFORM_DOOR_COL, 'size'),
+                MTTFF_Days=('MTTFF_Days', 'first'),
+                Failure_Prob=('Failure_Prob', 'first'),
+                Top_Risk_Component=('Top_Risk_Component', 'first'),
+            )
+            .head(DOOR_TOP_N)
+        )
+        st.dataframe(
+            pd.DataFrame({
+                translations[lang]['door_col_station']: top_profiles_df['Station_Display'],
+                translations[lang]['location_type_legend_label']: top_profiles_df[LOCATION_COL].map(
+                    lambda loc: translations[lang].get(f'location_{str(loc).lower().replace(" ", "_")}', loc)
+                ),
+                translations[lang]['station_daily_runs']: top_profiles_df[STATION_RUNS_COL].round(1),
+                translations[lang]['door_col_door_count']: top_profiles_df['Door_Count'],
+                translations[lang]['door_col_mttff']: (top_profiles_df['MTTFF_Days'] / 365).round(2),
+                translations[lang]['door_col_failure_prob']: top_profiles_df['Failure_Prob'].map(lambda p: f"{p:.1%}"),
+                translations[lang]['door_col_top_component']: top_profiles_df['Top_Risk_Component'].map(lambda c: door_display_map.get(c, c)),
+            }),
+            hide_index=True
+        )
+
+        # Fleet-wide view of which components drive door failures
+        fleet_shares = {
+            component_en: door_results_df[f'Risk_Share_{component_en}'].mean()
+            for component_en in door_curves['components']
+        }
+        fig = plot_risk_shares(fleet_shares, translations[lang]['fleet_risk_share_title'], lang, door_display_map)
+        if fig:
+            st.plotly_chart(fig, use_container_width=True)
+
+        # Single door drill-down, doors listed from highest to lowest risk
+        selected_door_idx = st.selectbox(
+            translations[lang]["select_door_label"],
+            options=ranked_doors_df.index.tolist(),
+            format_func=lambda idx: f"{door_results_df.at[idx, door_station_col]} {door_results_df.at[idx, PLATFORM_DOOR_COL]}"
+        )
+        if selected_door_idx is not None:
+            door_row = door_results_df.loc[selected_door_idx]
+            door_label = f"{door_row[door_station_col]} {door_row[PLATFORM_DOOR_COL]}"
+            st.metric(
+                translations[lang]["door_mttff_metric_label"],
+                f"{door_row['MTTFF_Days']:.1f} {translations[lang]['median_ttf_metric_unit_days']}",
+                f"{door_row['MTTFF_Days']/365:.1f} {translations[lang]['median_ttf_metric_unit_years']}"
+            )
+            door_col1, door_col2 = st.columns(2)
+            with door_col1:
+                fig = plot_door_reliability(selected_door_idx, door_label, door_curves, lang, door_display_map)
+                if fig:
+                    st.plotly_chart(fig, use_container_width=True)
+            with door_col2:
+                door_shares = {
+                    component_en: door_row[f'Risk_Share_{component_en}']
+                    for component_en in door_curves['components']
+                }
+                fig = plot_risk_shares(door_shares, f"{translations[lang]['door_risk_share_title']} {door_label}", lang, door_display_map)
+                if fig:
+                    st.plotly_chart(fig, use_container_width=True)
+
 if __name__ == "__main__":
     main() 
\ No newline at end of file